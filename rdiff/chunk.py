@@ -1,10 +1,34 @@
 from typing import Any, Optional, Union
 from collections.abc import Iterable, Iterator, Sequence
 from functools import reduce, cached_property
+from itertools import chain
 from operator import add
 from dataclasses import dataclass
 
 
+def _concat(parts: Sequence[Sequence[Any]]) -> Sequence[Any]:
+    """
+    Concatenates sequences of the same type.
+
+    Parameters
+    ----------
+    parts
+        Sequences to concatenate.
+
+    Returns
+    -------
+    The concatenated sequence.
+    """
+    if not parts:
+        raise TypeError("nothing to concatenate")
+    t = type(parts[0])
+    if t is str or t is bytes:
+        return t().join(parts)
+    if t is list or t is tuple:
+        return t(chain.from_iterable(parts))
+    return reduce(add, parts)
+
+
 @dataclass(frozen=True)
 class ChunkSignature:
     """
@@ -184,7 +208,7 @@ class Diff:
         """
         if self.diffs is None:
             raise ValueError("no diff data")
-        return reduce(add, (i.data_a for i in self.diffs))
+        return _concat([i.data_a for i in self.diffs])
 
     def get_b(self):
         """
@@ -196,7 +220,7 @@ class Diff:
         """
         if self.diffs is None:
             raise ValueError("no diff data")
-        return reduce(add, (i.data_b for i in self.diffs))
+        return _concat([i.data_b for i in self.diffs])
 
     def to_string(self, prefix: str = "", uri_a: str = "a", uri_b: str = "b") -> str:
         preamble = f"{prefix}{uri_a}≈{uri_b} (ratio={self.ratio:.4f})"
@@ -4,7 +4,7 @@ from typing import Optional
 from collections.abc import Iterator, Sequence, Callable
 import re
 import fnmatch
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
@@ -49,6 +49,7 @@ reject_all = MatchRule(False)
 class RegexMatchRule(MatchRule):
     pattern: str
     pattern_str: str = None
+    compiled: re.Pattern = field(init=False, repr=False, compare=False)
     """
     A rule matching paths.
     
@@ -60,9 +61,12 @@ class RegexMatchRule(MatchRule):
         Regex pattern to match.
     pattern_str
         The representation of the regex pattern.
+    compiled
+        The compiled regex pattern.
     """
     def __post_init__(self):
         object.__setattr__(self, "pattern_str", self.pattern_str or self.pattern)
+        object.__setattr__(self, "compiled", re.compile(self.pattern))
 
     @classmethod
     def from_glob(cls, accept: bool, glob_pattern: str):
@@ -95,7 +99,7 @@ class RegexMatchRule(MatchRule):
         -------
         True if the key matches.
         """
-        return bool(re.fullmatch(self.pattern, key))
+        return self.compiled.fullmatch(key) is not None
 
     def __str__(self):
         prefix = "include" if self.accept else "exclude"
@@ -20,6 +20,7 @@ def process_iter(
         max_cost_row: int = MAX_COST,
         mime: Optional[str] = None,
         table_drop_cols: Optional[Sequence[tuple[str, list[str]]]] = None,
+        table_max_workers: int = 1,
         sort: bool = False,
 ) -> Iterator[AnyDiff]:
     """
@@ -53,6 +54,9 @@ def process_iter(
         The MIME of the two paths.
     table_drop_cols
         Table columns to drop when comparing tables.
+    table_max_workers
+        The number of processes to compare tables of
+        multi-table files in.
     sort
         If True, sorts files.
 
@@ -65,10 +69,12 @@ def process_iter(
 
     transform = None
     if rename:
+        rename = [(re.compile(pattern), replacement) for pattern, replacement in rename]
+
         def transform(child_path: Path) -> str:
             result = str(child_path)
-            for args in rename:
-                result = re.sub(*args, result, count=1)
+            for pattern, replacement in rename:
+                result = pattern.sub(replacement, result, count=1)
             return result
 
     for child_a, child_b, readable_name in iter_match(a, b, rules=rules, transform=transform, sort=sort):
@@ -85,4 +91,5 @@ def process_iter(
                 max_cost=max_cost,
                 max_cost_row=max_cost_row,
                 table_drop_cols=table_drop_cols,
+                table_max_workers=table_max_workers,
             )
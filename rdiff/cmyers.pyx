@@ -1,6 +1,7 @@
 # cython: language_level=3
 from cpython.ref cimport PyObject
-from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from cpython.mem cimport PyMem_Malloc, PyMem_Calloc, PyMem_Free
+from libc.string cimport memset
 import array
 import cython
 from warnings import warn
@@ -544,3 +545,125 @@ def search_graph_recursive(
     finally:
         PyMem_Free(buffer_1)
         PyMem_Free(buffer_2)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def bitparallel_lcs_len(unicode a, unicode b) -> int:
+    """
+    Computes the length of the longest common subsequence
+    of two strings using the bit-parallel algorithm by Hyyrö.
+    The diff cost is then ``len(a) + len(b) - 2 * lcs``.
+    The run time scales as ``len(a) * len(b) / 64`` after
+    stripping the common prefix and suffix.
+
+    Parameters
+    ----------
+    a
+        The first string, preferably the shorter one.
+    b
+        The second string.
+
+    Returns
+    -------
+    The length of the longest common subsequence.
+    """
+    cdef:
+        unsigned long long *peq
+        unsigned long long *v
+        unsigned long long *match
+        unsigned long long x, u, s, d, carry, borrow, one = 1
+        Py_ssize_t i, k, row, n_words, n_rows
+        Py_ssize_t a_lo = 0, a_hi = len(a), b_lo = 0, b_hi = len(b), result = 0
+        Py_UCS4 c
+
+    # strip the common prefix and suffix
+    while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+        a_lo += 1
+        b_lo += 1
+    while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+        a_hi -= 1
+        b_hi -= 1
+    result = a_lo + len(a) - a_hi
+    if a_lo == a_hi or b_lo == b_hi:
+        return result
+
+    # rows of match masks: characters below 256 are rows themselves,
+    # other characters of a are enumerated after them
+    extra = {}
+    for i in range(a_lo, a_hi):
+        c = a[i]
+        if c >= 256 and c not in extra:
+            extra[c] = 256 + len(extra)
+    n_rows = 256 + len(extra)
+    n_words = (a_hi - a_lo + 63) // 64
+
+    peq = <unsigned long long *>PyMem_Calloc(n_rows * n_words, sizeof(unsigned long long))
+    v = <unsigned long long *>PyMem_Malloc(n_words * sizeof(unsigned long long))
+    if peq == NULL or v == NULL:
+        PyMem_Free(peq)
+        PyMem_Free(v)
+        raise MemoryError
+
+    try:
+        # bit i is set if a[i] is the character
+        for i in range(a_hi - a_lo):
+            c = a[a_lo + i]
+            row = c if c < 256 else extra[c]
+            peq[row * n_words + i // 64] |= one << (i % 64)
+        for k in range(n_words):
+            v[k] = ~0ULL
+
+        for i in range(b_lo, b_hi):
+            c = b[i]
+            if c < 256:
+                row = c
+            else:
+                row = extra.get(c, -1)
+                if row == -1:  # no matches: v does not change
+                    continue
+            match = peq + row * n_words
+            # multi-word v = (v + u) | (v - u) with u = v & match
+            carry = borrow = 0
+            for k in range(n_words):
+                x = v[k]
+                u = x & match[k]
+                s = x + u
+                d = x - u
+                v[k] = (s + carry) | (d - borrow)
+                carry = (s < x) | ((s + carry) < s)
+                borrow = (x < u) | (d < borrow)
+
+        # zero bits count towards the subsequence length
+        for i in range(a_hi - a_lo):
+            result += not (v[i // 64] >> (i % 64)) & 1
+        return result
+    finally:
+        PyMem_Free(peq)
+        PyMem_Free(v)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def canonize(signed char[::1] codes):
+    """See the description of the pure-python implementation."""
+    cdef:
+        Py_ssize_t code_i, i, n = codes.shape[0], n_horizontal = 0, n_vertical = 0
+        signed char code
+
+    with nogil:
+        for code_i in range(n + 1):
+            if code_i != n:
+                code = codes[code_i] & 3  # same as % 4 for negative values
+            else:
+                code = 0
+            if code == 1:
+                n_horizontal += 1
+            elif code == 2:
+                n_vertical += 1
+            elif n_horizontal + n_vertical:
+                for i in range(code_i - n_horizontal - n_vertical, code_i - n_vertical):
+                    codes[i] = 1
+                for i in range(code_i - n_vertical, code_i):
+                    codes[i] = 2
+                n_horizontal = n_vertical = 0
@@ -1,13 +1,17 @@
 from pathlib import Path
 from typing import Callable, TypeVar, Optional
 from dataclasses import dataclass
-import filecmp
-from functools import partial
-
-import pandas as pd
+import os
+import csv
+import locale
+from codecs import getincrementaldecoder
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from mmap import mmap, ACCESS_READ
+from functools import partial, lru_cache
 
 from .base import AnyDiff
-from .text import TextDiff, diff as _diff_text
+from .text import TextDiff, diff as _diff_text, _LineView, _has_lone_cr
 from .table import TableDiff, diff as _diff_table
 from ..sequence import MAX_COST
 
@@ -18,9 +22,20 @@ except ImportError:
     magic = magic_guess_custom = None
 
 try:
-    import pandas
+    import puremagic
+except ImportError:
+    puremagic = None
+
+try:
+    import pandas as pd
 except ImportError:
-    pandas = None
+    pd = None
+
+try:
+    import pyarrow
+    from pyarrow import csv as pa_csv, compute as pa_compute
+except ImportError:
+    pyarrow = pa_csv = pa_compute = None
 
 
 DiffKernel = Callable[[Path, Path, str], AnyDiff]
@@ -28,6 +43,108 @@ T = TypeVar("T", bound=DiffKernel)
 
 
 mime_dispatch: dict[str, DiffKernel] = {}
+table_kernels: set[DiffKernel] = set()
+multi_table_kernels: set[DiffKernel] = set()
+
+
+@lru_cache(maxsize=4096)
+def _guess_mime_cached(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    if magic_guess_custom is not None:
+        return magic_guess_custom.from_file(path)
+    # pure-python fallback: matches file header and extension
+    if size == 0:
+        return "text/plain"
+    try:
+        result = puremagic.from_file(path, mime=True) or None
+    except (puremagic.PureError, ValueError):
+        result = None
+    if result is None or result.startswith("text/"):
+        # text guesses may come from the extension or a BOM alone: verify the contents
+        if _looks_like_text(path):
+            # puremagic does not detect plain text by content and knows many text subtypes
+            return result if result in mime_dispatch else "text/plain"
+        return None if result is None else "application/octet-stream"
+    return result
+
+
+def _looks_like_text(path: str, block_size: int = 1 << 12) -> bool:
+    """
+    Checks whether the file header is UTF-8 text without
+    null bytes.
+
+    Parameters
+    ----------
+    path
+        The file path.
+    block_size
+        The number of bytes to check.
+
+    Returns
+    -------
+    True if the file looks like text.
+    """
+    with open(path, "rb") as f:
+        header = f.read(block_size)
+    if b"\0" in header:
+        return False
+    try:
+        # final=False: the block may end in the middle of a multibyte character
+        getincrementaldecoder("utf-8")().decode(header, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _guess_mime(path: Path) -> Optional[str]:
+    """
+    Guesses file MIME using libmagic or, if not available,
+    puremagic. The result is cached by the file path,
+    modification time and size.
+
+    Parameters
+    ----------
+    path
+        The file path.
+
+    Returns
+    -------
+    The MIME string or None if it could not be determined.
+    """
+    st = os.stat(path)
+    return _guess_mime_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _binary_eq(a: Path, b: Path, block_size: int = 1 << 20) -> bool:
+    """
+    Checks whether two files are binary equal.
+
+    Parameters
+    ----------
+    a
+    b
+        The two file paths.
+    block_size
+        The size of blocks to compare.
+
+    Returns
+    -------
+    True if files are binary equal.
+    """
+    # different sizes: no need to read contents
+    if (size := os.stat(a).st_size) != os.stat(b).st_size:
+        return False
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        if size <= block_size:
+            return fa.read() == fb.read()
+        # large files: overlap reads of the two files
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            while True:
+                future_b = pool.submit(fb.read, block_size)
+                block_a = fa.read(block_size)
+                if block_a != future_b.result():
+                    return False
+                if not block_a:
+                    return True
 
 
 @dataclass
@@ -111,7 +228,7 @@ class CompositeDiff(AnyDiff):
         return all(i.is_eq() for i in self.items)
 
 
-def mime_kernel(*args: str) -> Callable[[T], T]:
+def mime_kernel(*args: str, table: bool = False, multi_table: bool = False) -> Callable[[T], T]:
     """
     Associates a diff function with one or more MIME types.
 
@@ -119,10 +236,20 @@ def mime_kernel(*args: str) -> Callable[[T], T]:
     ----------
     args
         MIME strings.
+    table
+        If True, marks the diff function as a table kernel
+        accepting table-specific arguments.
+    multi_table
+        If True, marks the diff function as a kernel comparing
+        multiple tables per file and accepting ``max_workers``.
     """
     def _decorate(kernel: T) -> T:
         for i in args:
             mime_dispatch[i] = kernel
+        if table:
+            table_kernels.add(kernel)
+        if multi_table:
+            multi_table_kernels.add(kernel)
         return kernel
     return _decorate
 
@@ -167,9 +294,26 @@ def diff_text(
     -------
     The text diff.
     """
-    with open(a, "r") as fa, open(b, "r") as fb:
-        return _diff_text(list(fa), list(fb), name, min_ratio=min_ratio, min_ratio_row=min_ratio_row,
+    encoding = locale.getpreferredencoding(False)
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        # memory-map files and decode lines lazily instead of reading them into lists
+        buffers = [
+            mmap(f.fileno(), 0, access=ACCESS_READ) if os.fstat(f.fileno()).st_size else b""
+            for f in (fa, fb)
+        ]
+    try:
+        if any(map(_has_lone_cr, buffers)):
+            # universal newlines: let the text mode split lines
+            with open(a, "r") as fa, open(b, "r") as fb:
+                lines_a, lines_b = list(fa), list(fb)
+        else:
+            lines_a, lines_b = (_LineView(i, encoding) for i in buffers)
+        return _diff_text(lines_a, lines_b, name, min_ratio=min_ratio, min_ratio_row=min_ratio_row,
                           max_cost=max_cost, max_cost_row=max_cost_row)
+    finally:
+        for i in buffers:
+            if isinstance(i, mmap):
+                i.close()
 
 
 def diff_pd(
@@ -215,15 +359,13 @@ def diff_pd(
     The table diff.
     """
     if table_drop_cols is not None:
-        a = a.copy()
-        b = b.copy()
-        for df in a, b:
-            df.drop(columns=table_drop_cols, inplace=True, errors="ignore")
+        a = a.drop(columns=table_drop_cols, errors="ignore")
+        b = b.drop(columns=table_drop_cols, errors="ignore")
     return _diff_table(a=a, b=b, name=name, min_ratio=min_ratio, min_ratio_row=min_ratio_row, max_cost=max_cost,
                        max_cost_row=max_cost_row)
 
 
-if pandas:
+if pd is not None:
     def diff_pd_simple(
             reader: Callable[[Path], pd.DataFrame],
             a: Path,
@@ -281,9 +423,51 @@ if pandas:
         )
 
 
-    diff_pd_csv = mime_kernel("text/csv")(partial(diff_pd_simple, partial(pd.read_csv, dtype=str, keep_default_na=False, na_filter=False, encoding_errors="replace")))
-    diff_pd_feather = mime_kernel("application/vnd.apache.arrow.file")(partial(diff_pd_simple, pd.read_feather))
-    diff_pd_parquet = mime_kernel("application/vnd.apache.parquet")(partial(diff_pd_simple, pd.read_parquet))
+    _read_csv_pd = partial(pd.read_csv, dtype=str, keep_default_na=False, na_filter=False, encoding_errors="replace")
+
+
+    def _read_csv(path: Path) -> pd.DataFrame:
+        """
+        Reads a csv file with all columns as strings.
+
+        Uses the multithreaded pyarrow parser if available and
+        falls back to pandas for inputs that pyarrow handles
+        differently.
+
+        Parameters
+        ----------
+        path
+            The path to the csv file.
+
+        Returns
+        -------
+        The table.
+        """
+        if pa_csv is not None:
+            with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+                header = next(csv.reader(f), None)
+            # pandas renames empty and duplicate header names: leave those to pandas
+            if header and all(header) and len(set(header)) == len(header):
+                try:
+                    table = pa_csv.read_csv(path, convert_options=pa_csv.ConvertOptions(
+                        column_types={i: pyarrow.string() for i in header},
+                        strings_can_be_null=False,
+                        quoted_strings_can_be_null=False,
+                    ))
+                except pyarrow.ArrowInvalid:  # invalid utf-8, ragged rows, etc.
+                    pass
+                else:
+                    # pandas truncates cells at null characters
+                    if all(i == pyarrow.string() for i in table.schema.types) and not any(
+                        pa_compute.any(pa_compute.match_substring(i, "\0")).as_py() for i in table.columns
+                    ):
+                        return table.to_pandas()
+        return _read_csv_pd(path)
+
+
+    diff_pd_csv = mime_kernel("text/csv", table=True)(partial(diff_pd_simple, _read_csv))
+    diff_pd_feather = mime_kernel("application/vnd.apache.arrow.file", table=True)(partial(diff_pd_simple, pd.read_feather))
+    diff_pd_parquet = mime_kernel("application/vnd.apache.parquet", table=True)(partial(diff_pd_simple, pd.read_parquet))
 
 
     def diff_pd_dict(
@@ -296,6 +480,8 @@ if pandas:
             max_cost: int = MAX_COST,
             max_cost_row: int = MAX_COST,
             table_drop_cols: Optional[list[str]] = None,
+            max_workers: int = 1,
+            fill_na: bool = True,
     ) -> CompositeDiff:
         """
         Computes a table diff between two pandas-supported files with multiple tables.
@@ -326,6 +512,13 @@ if pandas:
             The maximal cost below which two lines of text are aligned.
         table_drop_cols
             Columns to drop before comparing.
+        max_workers
+            The number of processes to compare tables in. Tables
+            are compared in the current process by default.
+        fill_na
+            If True, replaces NA values produced by the reader
+            with empty strings. Readers with NA parsing disabled
+            may skip this step.
 
         Returns
         -------
@@ -337,32 +530,40 @@ if pandas:
 
         for dfs in a, b:
             for df in dfs.values():
-                df = df.set_axis(map(str, df.columns), axis=1, copy=False)
-                df.fillna("", inplace=True)
+                df.columns = df.columns.astype(str)
+                if fill_na:
+                    df.fillna("", inplace=True)
 
         result = []
+        keys_a = set(a)
+        keys_b = set(b)
 
-        for i in set(a) - set(b):
+        for i in keys_a - keys_b:
             result.append(DeltaDiff(fmt % (name, i), True))
-        for i in set(b) - set(a):
+        for i in keys_b - keys_a:
             result.append(DeltaDiff(fmt % (name, i), False))
-        for i in set(a) & set(b):
-            result.append(
-                diff_pd(
-                    a=a[i],
-                    b=b[i],
-                    name=fmt % (name, i),
-                    min_ratio=min_ratio,
-                    min_ratio_row=min_ratio_row,
-                    max_cost=max_cost,
-                    max_cost_row=max_cost_row,
-                    table_drop_cols=table_drop_cols,
-                )
-            )
+
+        common = list(keys_a & keys_b)
+        kernel = partial(
+            diff_pd,
+            min_ratio=min_ratio,
+            min_ratio_row=min_ratio_row,
+            max_cost=max_cost,
+            max_cost_row=max_cost_row,
+            table_drop_cols=table_drop_cols,
+        )
+        args = [a[i] for i in common], [b[i] for i in common], [fmt % (name, i) for i in common]
+        max_workers = min(max_workers, len(common))
+        if max_workers > 1:
+            # spawned workers: forking a process with reader threads may deadlock
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn")) as executor:
+                result.extend(executor.map(kernel, *args))
+        else:
+            result.extend(map(kernel, *args))
         return CompositeDiff(name, result)
 
 
-    diff_pd_excel = mime_kernel("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "application/vnd.ms-excel")(partial(diff_pd_dict, partial(pd.read_excel, dtype=str, keep_default_na=False, na_filter=False, sheet_name=None)))
+    diff_pd_excel = mime_kernel("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "application/vnd.ms-excel", table=True, multi_table=True)(partial(diff_pd_dict, partial(pd.read_excel, dtype=str, keep_default_na=False, na_filter=False, sheet_name=None), fill_na=False))
 
 
 def diff_path(
@@ -375,6 +576,7 @@ def diff_path(
         max_cost: int = MAX_COST,
         max_cost_row: int = MAX_COST,
         table_drop_cols: Optional[list[str]] = None,
+        table_max_workers: int = 1,
 ) -> AnyDiff:
     """
     Computes a diff between two files based on their (common) MIME.
@@ -405,27 +607,34 @@ def diff_path(
         The maximal cost below which two lines of text are aligned.
     table_drop_cols
         Table columns to drop when comparing tables.
+    table_max_workers
+        The number of processes to compare tables of
+        multi-table files in.
 
     Returns
     -------
     The diff.
     """
-    if filecmp.cmp(a, b, shallow=False):
+    if os.path.samefile(a, b):
+        return PathDiff(name, eq=True, message="same file")
+    if _binary_eq(a, b):
         return PathDiff(name, eq=True, message="files are binary equal")
-    if mime is None and magic is not None:
-        a_mime = magic_guess_custom.from_file(a)
-        b_mime = magic_guess_custom.from_file(b)
+    if mime is None and (magic is not None or puremagic is not None):
+        a_mime = _guess_mime(a)
+        b_mime = _guess_mime(b)
         if a_mime != b_mime:
             return MIMEDiff(name, a_mime, b_mime)
         mime = a_mime
     if mime is None:
-        return PathDiff(name, eq=False, message=f"failed to determine MIME; tried libmagic: {magic is not None}")
-    try:
-        kernel = mime_dispatch[mime]
-    except KeyError:
+        return PathDiff(name, eq=False, message=f"failed to determine MIME; tried libmagic: {magic is not None}, "
+                                                  f"puremagic: {puremagic is not None}")
+    kernel = mime_dispatch.get(mime)
+    if kernel is None:
         return PathDiff(name, eq=False, message=f"unknown common MIME: {mime}")
     kwargs = {}
-    if kernel in (diff_pd_csv, diff_pd_feather, diff_pd_parquet, diff_pd_excel):
+    if kernel in table_kernels:
         kwargs["table_drop_cols"] = table_drop_cols
+    if kernel in multi_table_kernels:
+        kwargs["max_workers"] = table_max_workers
     return kernel(a, b, name, min_ratio=min_ratio, min_ratio_row=min_ratio_row, max_cost=max_cost,
                   max_cost_row=max_cost_row, **kwargs)
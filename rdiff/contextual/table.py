@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Union, Optional
 
 import numpy as np
@@ -15,7 +16,78 @@ except ImportError:
     pd = None
 
 
-@dataclass
+def _hash(a: np.ndarray) -> np.ndarray:
+    """
+    Computes element-wise hashes of an array.
+
+    Parameters
+    ----------
+    a
+        The array to hash.
+
+    Returns
+    -------
+    An integer array of the same shape with hashes.
+    """
+    if pd is not None:
+        flat = a.ravel()
+        # hash_array casts mixed-type object arrays to str: 1 and "1" would collide
+        if flat.dtype != object or pd.api.types.infer_dtype(flat, skipna=False) == "string":
+            try:
+                # vectorized hashing of the flat buffer
+                return pd.util.hash_array(flat).view(np.int64).reshape(a.shape)
+            except TypeError:
+                pass
+    return np.array(list(map(hash, a.flat)), dtype=int).reshape(a.shape)
+
+
+def _native_hash_dtype(a, b) -> bool:
+    """
+    Checks whether two data frames can be hashed column-wise
+    in their native types. This requires all columns of both
+    frames to share the same integer or boolean dtype: raw
+    buffer hashes of different dtypes, such as ``1`` and
+    ``1.0``, never match. Floats are left out as raw hashes
+    tell ``0.0`` and ``-0.0`` apart.
+
+    Parameters
+    ----------
+    a
+    b
+        The data frames to check.
+
+    Returns
+    -------
+    True if both frames can be hashed natively.
+    """
+    dtypes = {*a.dtypes, *b.dtypes}
+    if len(dtypes) != 1:
+        return False
+    dtype, = dtypes
+    return isinstance(dtype, np.dtype) and dtype.kind in "biu"
+
+
+def _hash_frame(df) -> np.ndarray:
+    """
+    Computes element-wise hashes of an integer data frame
+    without casting its cells into python objects.
+
+    Parameters
+    ----------
+    df
+        The data frame to hash.
+
+    Returns
+    -------
+    An integer array of the same shape with hashes.
+    """
+    result = np.empty(df.shape, dtype=np.int64)
+    for i in range(df.shape[1]):
+        result[:, i] = pd.util.hash_array(df.iloc[:, i].to_numpy()).view(np.int64)
+    return result
+
+
+@dataclass(frozen=True)
 class Columns:
     a: Sequence[str]
     b: Sequence[str]
@@ -29,6 +101,20 @@ class Columns:
         Column names in a and b.
     """
 
+    def is_eq(self) -> bool:
+        """
+        Checks if column names are the same.
+
+        Returns
+        -------
+        True if equal.
+        """
+        return self._is_eq
+
+    @cached_property
+    def _is_eq(self) -> bool:
+        return np.array_equal(self.a, self.b)
+
 
 @dataclass
 class TableDiff(AnyDiff):
@@ -114,22 +200,23 @@ def diff(
     if not (t_a := type(a)) == (t_b := type(b)):
         raise ValueError(f"type(a)={t_a} != type(b)={t_b}")
 
-    def _hash(_a: np.ndarray) -> np.ndarray:
-        # TODO might need a faster hash
-        return np.array(list(map(hash, _a.flatten())), dtype=int).reshape(_a.shape)
-
+    eq = None
     if issubclass(t_a, np.ndarray):
         a = a.astype(dtype)
         b = b.astype(dtype)
 
     elif pd is not None and issubclass(t_a, pd.DataFrame):
+        if _native_hash_dtype(a, b):
+            # hash native buffers: boxing cells is only needed for the aligned output
+            eq = _hash_frame(a), _hash_frame(b)
         a = a.to_numpy(dtype=dtype)
         b = b.to_numpy(dtype=dtype)
 
     else:
         raise ValueError(f"unknown input type: {t_a}")
 
-    eq = tuple(map(_hash, (a, b)))
+    if eq is None:
+        eq = tuple(map(_hash, (a, b)))
 
     np_diff = diff_aligned_2d(
         a=a,
@@ -1,9 +1,81 @@
 from dataclasses import dataclass
 from collections.abc import Sequence
+from functools import lru_cache, partial
+
+import numpy as np
 
 from .base import AnyDiff
 from ..sequence import MAX_COST, diff_nested
-from ..chunk import Diff
+from ..chunk import Diff, Chunk
+
+
+def _decode_line(buffer, offsets: list[int], encoding: str, i: int) -> str:
+    return buffer[offsets[i]:offsets[i + 1]].decode(encoding).replace("\r\n", "\n")
+
+
+def _has_lone_cr(buffer) -> bool:
+    """
+    Checks whether a buffer contains carriage returns
+    which are not followed by a line feed.
+
+    Parameters
+    ----------
+    buffer
+        The buffer with text.
+
+    Returns
+    -------
+    True if a standalone carriage return is found.
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    cr = np.flatnonzero(data == 13)
+    if len(cr) == 0:
+        return False
+    if cr[-1] == len(data) - 1:
+        return True
+    return not (data[cr + 1] == 10).all()
+
+
+class _LineView(Sequence):
+    """
+    A lazy sequence of text lines backed by a bytes-like
+    buffer. Lines are decoded on access. Only ``\n`` and
+    ``\r\n`` line breaks are recognized: see ``_has_lone_cr``.
+
+    Parameters
+    ----------
+    buffer
+        The buffer with text.
+    encoding
+        Text encoding.
+    cache_size
+        The number of decoded lines to cache.
+    """
+    def __init__(self, buffer, encoding: str = "utf-8", cache_size: int = 4096):
+        self.buffer = buffer
+        self.encoding = encoding
+        ends = np.flatnonzero(np.frombuffer(buffer, dtype=np.uint8) == 10) + 1
+        if len(buffer) and (len(ends) == 0 or ends[-1] != len(buffer)):
+            ends = np.append(ends, len(buffer))  # last line without a line break
+        self.offsets = np.concatenate(([0], ends)).tolist()
+        # the cached function does not reference self: views are freed without a gc pass
+        self._line = lru_cache(maxsize=cache_size)(partial(_decode_line, buffer, self.offsets, encoding))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, item):
+        n = len(self)
+        if isinstance(item, slice):
+            return [self._line(i) for i in range(*item.indices(n))]
+        if item < 0:
+            item += n
+        if not 0 <= item < n:
+            raise IndexError("line index out of range")
+        return self._line(item)
+
+    def __repr__(self):
+        return repr(self[:])
 
 
 @dataclass
@@ -69,7 +141,14 @@ def diff(
         min_ratio=(min_ratio, min_ratio_row),
         max_cost=(max_cost, max_cost_row),
         max_recursion=2,
+        nested_containers=(list, tuple, _LineView),
     )
+    # do not let line views escape into the diff: they may reference buffers to be closed
+    raw_diff = Diff(ratio=raw_diff.ratio, diffs=[
+        Chunk(data_a=i.data_a[:], data_b=i.data_b[:], eq=i.eq)
+        if isinstance(i.data_a, _LineView) or isinstance(i.data_b, _LineView) else i
+        for i in raw_diff.diffs
+    ])
     return TextDiff(
         name=name,
         data=raw_diff,
@@ -1,10 +1,11 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from sys import stdout
 from io import TextIOBase
 import os
 from typing import Union, Any, Optional
 from collections.abc import Sequence, Callable, Iterator
-from itertools import groupby
+from itertools import groupby, islice
 
 from ..contextual.base import AnyDiff
 from ..contextual.table import TableDiff
@@ -41,6 +42,27 @@ def align(s: str, n: int, elli: str = "…", fill: str = " ", just=str.ljust) ->
         return just(s, n, fill)
 
 
+def compile_format(fmt: str) -> Callable[[str], str]:
+    """
+    Compiles a printf-style format with a single argument.
+    Formats with a single ``%s`` placeholder are turned into
+    plain string concatenation.
+
+    Parameters
+    ----------
+    fmt
+        The format to compile.
+
+    Returns
+    -------
+    A function formatting its only argument.
+    """
+    pre, sep, suf = fmt.partition("%s")
+    if sep and "%" not in pre and "%" not in suf:
+        return lambda s: pre + s + suf
+    return lambda s: fmt % (s,)
+
+
 class TableBreak(str):
     pass
 
@@ -55,6 +77,8 @@ class Table:
     data: list[Union[tuple[str, ...], str]] = field(default_factory=list)
     etc: str = "..."
     pre_str: Callable[(Any,), str] = str
+    _plan: list[tuple[bool, int]] = field(init=False, repr=False, compare=False)
+    _rows: list[tuple[str, ...]] = field(init=False, repr=False, compare=False)
     """
     Represents a simple table.
     
@@ -72,18 +96,19 @@ class Table:
         A function pre-converting objects to str.
     """
 
+    def __post_init__(self):
+        # lengths of consecutive blocks of displayed and skipped columns
+        self._plan = [(key, sum(1 for _ in group)) for key, group in groupby(self.column_mask)]
+        # rows with cells, excluding breaks and lines
+        self._rows = [d for d in self.data if type(d) is tuple]
+
     @property
     def row_len(self) -> int:
         """
         The number of rows displayed, including placeholders
         for rows that are skipped.
         """
-        return sum(
-            sum(1 for _ in group)
-            if key
-            else 1
-            for key, group in groupby(self.column_mask)
-        )
+        return sum(n if key else 1 for key, n in self._plan)
 
     def append_break(self, s: str):
         """
@@ -120,15 +145,15 @@ class Table:
         """
         row_repr = []
         row_iter = iter(row)
-        for key, group in groupby(self.column_mask):
+        for key, n in self._plan:
             if key:
-                for _ in group:
-                    row_repr.append(self.pre_str(next(row_iter)))
+                row_repr.extend(map(self.pre_str, islice(row_iter, n)))
             else:
-                for _ in group:
-                    next(row_iter)
+                next(islice(row_iter, n, n), None)
                 row_repr.append(self.etc)
-        self.data.append(tuple(row_repr))
+        row_repr = tuple(row_repr)
+        self.data.append(row_repr)
+        self._rows.append(row_repr)
 
     def get_full_widths(self) -> list[int]:
         """
@@ -138,7 +163,9 @@ class Table:
         -------
         A list of integers with row widths.
         """
-        return [max(len(d[i]) for d in self.data if type(d) is tuple) for i in range(self.row_len)]
+        if not self._rows:
+            return [0] * self.row_len
+        return [max(map(len, column)) for column in zip(*self._rows)]
 
     def compute(self, join: str, widths: Optional[list[int]] = None) -> Iterator[str]:
         """
@@ -164,12 +191,15 @@ class Table:
             elif isinstance(i, TableBreak):
                 yield str(i)
             elif isinstance(i, TableHline):
-                yield join.join((i * (w // len(i) + 1))[:w] for w in widths)
+                if len(i) == 1:
+                    yield join.join(i * w for w in widths)
+                else:
+                    yield join.join((i * (w // len(i) + 1))[:w] for w in widths)
             else:
                 raise ValueError(f"unknown row type: {type(i)}")
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TextFormats:
     skip_equal: str = "(%d lines match)"
     line_ctx: str = "  %s"
@@ -181,7 +211,7 @@ class TextFormats:
     chunk_rm: str = "---%s---"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TableFormats:
     skip_equal: str = "(%d rows match)"
     column_plain: str = "%s"
@@ -200,7 +230,7 @@ class TableFormats:
     hline: str = "-"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MarkdownTableFormats(TableFormats):
     row_head: str = "| "
     row_spacer: str = " | "
@@ -421,52 +451,55 @@ class TextPrinter(AbstractTextPrinter):
             The diff to print.
         """
         self.print_header(diff)
-        formats = {
-            (True, False, False): self.text_formats.line_rm,
-            (False, True, False): self.text_formats.line_add,
-            (True, True, False): self.text_formats.line_ctx,
-            (True, True, True): self.text_formats.line_aligned,
-        }
-
+        tf = self.text_formats
+        # indexed by a bit pattern: a is present, b is present, has inline diff
+        formats = [None] * 8
+        formats[0b100] = compile_format(tf.line_rm)
+        formats[0b010] = compile_format(tf.line_add)
+        formats[0b110] = compile_format(tf.line_ctx)
+        formats[0b111] = compile_format(tf.line_aligned)
+        chunk_rm = compile_format(tf.chunk_rm)
+        chunk_add = compile_format(tf.chunk_add)
+        skip_equal = tf.skip_equal
+        block_spacer = tf.block_spacer
+
+        buf = []
+        p = buf.append
         separator = False
-        for is_skip, group in groupby(diff.data.iter_important(context_size=self.context_size), lambda i: isinstance(i, int)):
+        for is_skip, group in groupby(diff.data.iter_important(context_size=self.context_size), lambda i: type(i) is int):
             if is_skip:
                 for i in group:
-                    self.printer.write(self.text_formats.skip_equal % (i,) + "\n")
+                    p(skip_equal % (i,) + "\n")
                     separator = False
             else:
-                for key, group_2 in groupby(group, lambda i: (i.a is not None, i.b is not None, i.diff is not None)):
+                for key, group_2 in groupby(group, lambda i: (i.a is not None) << 2 | (i.b is not None) << 1 | (i.diff is not None)):
                     if separator:
-                        self.printer.write(self.text_formats.block_spacer)
+                        p(block_spacer)
                     separator = True
                     fmt = formats[key]
                     for i in group_2:
                         if i.a is None:  # addition
-                            self.printer.write(fmt % (i.b,))
+                            p(fmt(i.b))
 
                         elif i.b is None:  # removal
-                            self.printer.write(fmt % (i.a,))
+                            p(fmt(i.a))
 
                         elif i.diff is None:  # context
-                            self.printer.write(fmt % (i.a,))
+                            p(fmt(i.a))
 
                         else:  # inline diff
                             assert i.diff is not None
-                            line = "".join(
-                                c.data_a
-                                if c.eq
-                                else
-                                "".join(
-                                    _fmt % (_i,)
-                                    for _fmt, _i in [
-                                        (self.text_formats.chunk_rm, c.data_a),
-                                        (self.text_formats.chunk_add, c.data_b),
-                                    ]
-                                    if _i
-                                )
-                                for c in i.diff.diffs
-                            )
-                            self.printer.write(fmt % (line,))
+                            line = []
+                            for c in i.diff.diffs:
+                                if c.eq:
+                                    line.append(c.data_a)
+                                else:
+                                    if c.data_a:
+                                        line.append(chunk_rm(c.data_a))
+                                    if c.data_b:
+                                        line.append(chunk_add(c.data_b))
+                            p(fmt("".join(line)))
+        self.printer.write("".join(buf))
 
     def print_table(self, diff: TableDiff):
         """
@@ -481,56 +514,62 @@ class TextPrinter(AbstractTextPrinter):
 
         # hide columns (optionally)
         if self.table_collapse_columns:
-            show_col = [True, *~diff.data.eq.all(axis=0)]
+            show_col = [True, *(~diff.data.eq.all(axis=0)).tolist()]
         else:
             show_col = [True] * (diff.data.eq.shape[1] + 1)
         table = Table(column_mask=show_col)
+        tf = self.table_formats
+        append_row = table.append_row
 
         # print column names
         if diff.columns is not None:
             row = [""]
             for col_a, col_b in zip(diff.columns.a, diff.columns.b):
                 if col_a == col_b:
-                    col = self.table_formats.column_plain % (col_a,)
+                    col = tf.column_plain % (col_a,)
                 elif not col_a:
-                    col = self.table_formats.column_add % (col_b,)
+                    col = tf.column_add % (col_b,)
                 elif not col_b:
-                    col = self.table_formats.column_rm % (col_a,)
+                    col = tf.column_rm % (col_a,)
                 else:
-                    col = self.table_formats.column_both % (col_a, col_b)
+                    col = tf.column_both % (col_a, col_b)
                 row.append(col)
-            table.append_row(row)
+            append_row(row)
 
-        table.append_hline(self.table_formats.hline)
+        table.append_hline(tf.hline)
 
         # print table data
         for i in diff.data.to_plain().iter_important(context_size=self.context_size):
-            if isinstance(i, int):
-                table.append_break(self.table_formats.skip_equal % (i,))
+            if type(i) is int:
+                table.append_break(tf.skip_equal % (i,))
             elif isinstance(i, Item):
 
                 if i.a is None:  # addition
-                    table.append_row([self.table_formats.ix_row_add % (i.ix_b,), *i.b])
+                    append_row([tf.ix_row_add % (i.ix_b,), *i.b])
 
                 elif i.b is None:  # removal
-                    table.append_row([self.table_formats.ix_row_rm % (i.ix_a,), *i.a])
+                    append_row([tf.ix_row_rm % (i.ix_a,), *i.a])
 
                 elif i.diff is None:  # context
                     if i.ix_a == i.ix_b:
-                        code = self.table_formats.ix_row_plain % (i.ix_a,)
+                        code = tf.ix_row_plain % (i.ix_a,)
                     else:
-                        code = self.table_formats.ix_row_both % (i.ix_a, i.ix_b)
-                    table.append_row([code, *i.a])
+                        code = tf.ix_row_both % (i.ix_a, i.ix_b)
+                    append_row([code, *i.a])
 
                 else:  # inline diff
-                    table.append_row([self.table_formats.ix_row_a % (i.ix_a,), *i.a])
-                    table.append_row([self.table_formats.ix_row_b % (i.ix_b,), *i.b])
+                    append_row([tf.ix_row_a % (i.ix_a,), *i.a])
+                    append_row([tf.ix_row_b % (i.ix_b,), *i.b])
 
-        for row in table.compute(self.table_formats.row_spacer):
-            self.printer.write(self.table_formats.row_head + row + self.table_formats.row_tail + "\n")
+        head = tf.row_head
+        tail = tf.row_tail
+        self.printer.write("".join(
+            f"{head}{row}{tail}\n"
+            for row in table.compute(tf.row_spacer)
+        ))
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TextSummaryFormats:
     ratio_fmt: str = "{:.4f}"
     ratio_non_fmt: str = "{:<6}"
@@ -561,17 +600,17 @@ class SummaryTextPrinter(TextPrinter):
         Text formats.
     """
 
-    @property
+    @cached_property
     def _empty_fmt(self) -> str:
         f = self.formats
         return f"{f.ratio_non_fmt}{f.sep}{f.n_equal_non_fmt}{f.sep}{f.n_aligned_non_fmt}{f.sep}{f.n_neq_non_fmt}{f.sep}{{}}"
 
-    @property
+    @cached_property
     def _ratio_fmt(self) -> str:
         f = self.formats
         return f"{f.ratio_fmt}{f.sep}{f.n_equal_non_fmt}{f.sep}{f.n_aligned_non_fmt}{f.sep}{f.n_neq_non_fmt}{f.sep}{{}}"
 
-    @property
+    @cached_property
     def _full_fmt(self) -> str:
         f = self.formats
         return f"{f.ratio_fmt}{f.sep}{f.n_equal_fmt}{f.sep}{f.n_aligned_fmt}{f.sep}{f.n_neq_fmt}{f.sep}{{}}"
@@ -626,9 +665,14 @@ class SummaryTextPrinter(TextPrinter):
             The diff to print.
         """
         if diff.data.diffs is not None:
-            n_eq = sum(len(i.data_a) for i in diff.data.diffs if i.eq is True)
-            n_al = sum(len(i.data_a) for i in diff.data.diffs if not isinstance(i.eq, bool))
-            n_ne = sum(len(i.data_a) for i in diff.data.diffs if i.eq is False)
+            n_eq = n_al = n_ne = 0
+            for i in diff.data.diffs:
+                if i.eq is True:
+                    n_eq += len(i.data_a)
+                elif i.eq is False:
+                    n_ne += len(i.data_a)
+                else:
+                    n_al += len(i.data_a)
             self.printer.write(self._full_fmt.format(diff.data.ratio, n_eq, n_al, n_ne, f"{diff.name}\n"))
         else:
             self.printer.write(self._ratio_fmt.format(diff.data.ratio, "", "", "", f"{diff.name}\n"))
@@ -642,7 +686,9 @@ class SummaryTextPrinter(TextPrinter):
         diff
             The diff to print.
         """
-        n_eq = diff.data.eq.all(axis=1).sum()
-        n_al = diff.data.eq.any(axis=1).sum()
-        n_ne = (~diff.data.eq).all(axis=1).sum()
+        eq = diff.data.eq
+        n_matching = eq.sum(axis=1)
+        n_eq = (n_matching == eq.shape[1]).sum()
+        n_ne = (n_matching == 0).sum()
+        n_al = len(n_matching) - n_ne  # any cell matches
         self.printer.write(self._full_fmt.format(diff.data.ratio, n_eq, n_al, n_ne, f"{diff.name}\n"))
@@ -1,4 +1,4 @@
-from collections.abc import Sequence, MutableSequence
+from collections.abc import Sequence, MutableSequence, Iterator
 from typing import Optional, Union
 from array import array
 from itertools import groupby
@@ -6,9 +6,13 @@ from warnings import warn
 
 from .chunk import Diff, Chunk
 from .myers import search_graph_recursive as pymyers, MAX_COST, MAX_CALLS, MAX_DEPTH, resume_search
-from .cmyers import search_graph_recursive as cmyers
+from .cmyers import search_graph_recursive as cmyers, bitparallel_lcs_len, canonize as ccanonize
 
 _nested_containers = (list, tuple)
+_unset_codes = array('b', [-1])
+_vectorize_codes_min_len = 512  # shorter codes are grouped faster in pure python
+_bitparallel_max_cells = 1 << 22  # larger problems are left to the kernel
+_bitparallel_myers_ratio = 10  # Myers probe budget: n * m / (n + m) / this number
 
 try:
     import numpy
@@ -118,11 +122,20 @@ def diff(
         assert len(_b) == m
         if accept <= 0:
             raise ValueError(f"{accept=} has to be strictly positive in atomic comparison")
+        if (
+                n and accept <= 1 and dig is None and resume is None and not isinstance(rtn_diff, array)
+                and type(_a) is type(_b) and type(_a) in (str, bytes) and _a == _b
+        ):
+            # equal strings: nothing to search for
+            if rtn_diff:
+                return Diff(ratio=1.0, diffs=[Chunk(data_a=a[0:n], data_b=b[0:m], eq=True)])
+            else:
+                return Diff(ratio=1.0, diffs=None)
     if isinstance(rtn_diff, array):
         codes = rtn_diff
         rtn_diff = False
     elif rtn_diff:
-        codes = array('b', b'\xFF' * (n + m))
+        codes = _unset_codes * (n + m)
     else:
         codes = None
 
@@ -150,6 +163,20 @@ def diff(
             no_python=no_python,
         )
 
+    elif (
+            codes is None and strict and _kernel is cmyers and max_calls == MAX_CALLS and accept <= 1
+            and isinstance(eq, tuple) and type(_a) is str and type(_b) is str
+            and n * m <= _bitparallel_max_cells
+            and max_cost > (probe_cost := n * m // (_bitparallel_myers_ratio * total_len))
+    ):
+        # the bit-parallel algorithm runs in n * m / 64 steps regardless of the cost
+        # while Myers runs in (n + m) * cost steps: probe Myers with a matching budget first
+        cost = cmyers(n=n, m=m, similarity_ratio_getter=eq, max_cost=probe_cost, no_python=no_python)
+        if cost > probe_cost:
+            if n > m:
+                _a, _b = _b, _a
+            cost = total_len - 2 * bitparallel_lcs_len(_a, _b)
+
     else:
         cost = _kernel(
             n=n,
@@ -172,7 +199,7 @@ def diff(
 
     ratio = (total_len - cost) / total_len
     if rtn_diff:
-        canonize(codes)
+        ccanonize(codes)
         return Diff(
             ratio=ratio,
             diffs=list(codes_to_chunks(a, b, codes, dig=dig)),
@@ -209,6 +236,48 @@ def canonize(codes: MutableSequence[int]):
             n_horizontal = n_vertical = 0
 
 
+def _code_groups(codes: Sequence[int]) -> Iterator[tuple[bool, int, int]]:
+    """
+    Groups canonized diff codes into runs of equal and
+    non-equal elements.
+
+    Parameters
+    ----------
+    codes
+        Diff codes.
+
+    Yields
+    ------
+    Triples with a flag telling whether the run is
+    non-equal and the numbers of elements in a and b.
+    """
+    if numpy is not None and len(codes) >= _vectorize_codes_min_len:
+        codes = numpy.asarray(codes)
+        codes = codes[codes != 0]
+        neq = (codes % 3) != 0
+        bounds = numpy.concatenate(([0], numpy.flatnonzero(neq[1:] != neq[:-1]) + 1, [len(codes)]))
+        cumsum_a = numpy.concatenate(([0], numpy.cumsum(codes % 2)))[bounds].tolist()
+        cumsum_b = numpy.concatenate(([0], numpy.cumsum(codes // 2)))[bounds].tolist()
+        yield from zip(
+            neq[bounds[:-1]].tolist(),
+            numpy.diff(cumsum_a).tolist(),
+            numpy.diff(cumsum_b).tolist(),
+        )
+        return
+
+    for neq, code_group in groupby((
+        code
+        for code in codes
+        if code != 0),
+        key=lambda x: bool(x % 3),
+    ):
+        n = m = 0
+        for code in code_group:
+            n += code % 2
+            m += code // 2
+        yield neq, n, m
+
+
 def codes_to_chunks(a: Sequence, b: Sequence, codes: Sequence[int], dig=None) -> list[Chunk]:
     """
     Given the original sequences and diff codes, produces diff chunks.
@@ -228,17 +297,9 @@ def codes_to_chunks(a: Sequence, b: Sequence, codes: Sequence[int], dig=None) ->
     A list of diff chunks.
     """
     offset_a = offset_b = 0
-    for neq, code_group in groupby((
-        code
-        for code in codes
-        if code != 0),
-        key=lambda x: bool(x % 3),
-    ):
-        n = offset_a
-        m = offset_b
-        for code in code_group:
-            n += code % 2
-            m += code // 2
+    for neq, size_a, size_b in _code_groups(codes):
+        n = offset_a + size_a
+        m = offset_b + size_b
 
         if neq or dig is None:
             yield Chunk(
@@ -270,10 +331,12 @@ def codes_to_chunks(a: Sequence, b: Sequence, codes: Sequence[int], dig=None) ->
 
 
 def _pop_optional(seq):
-    if isinstance(seq, Sequence):
-        return seq[0], seq[1:] if len(seq) > 1 else seq
-    else:
+    # concrete types first: the abstract Sequence check is comparably slow
+    # while this runs for every nested comparison
+    t = type(seq)
+    if t is not tuple and (t is int or t is float or not isinstance(seq, Sequence)):
         return seq, seq
+    return seq[0], seq[1:] if len(seq) > 1 else seq
 
 
 def diff_nested(
@@ -289,8 +352,8 @@ def diff_nested(
         rtn_diff: Union[bool, array] = True,
         nested_containers: tuple = _nested_containers,
         max_depth: int = MAX_DEPTH,
-        _blacklist_a: set = frozenset(),
-        _blacklist_b: set = frozenset(),
+        _blacklist_a: Optional[set] = None,
+        _blacklist_b: Optional[set] = None,
 ) -> Diff:
     """
     Computes a diff between nested sequences.
@@ -342,7 +405,8 @@ def diff_nested(
         Maximal recursion depth while exploring a and b.
     _blacklist_a
     _blacklist_b
-        Collections with object ids tracking possible circular references.
+        Sets with object ids of the containers being compared up the
+        stack, tracking possible circular references.
 
     Returns
     -------
@@ -378,10 +442,16 @@ def diff_nested(
     if (container_type := type(a_)) is type(b_):
         if container_type in nested_containers:
 
+            if _blacklist_a is None:
+                _blacklist_a = set()
+                _blacklist_b = set()
             if id(a_) in _blacklist_a or id(b_) in _blacklist_b:
                 raise ValueError("encountered recursive nesting of inputs")
-            _blacklist_a = {*_blacklist_a, id(a_)}
-            _blacklist_b = {*_blacklist_b, id(b_)}
+            # the nested calls below happen within this call only:
+            # ids are removed once the diff is computed
+            _blacklist_a.add(id(a_))
+            _blacklist_b.add(id(b_))
+            is_nested = True
 
             def _eq(i: int, j: int):
                 return diff_nested(
@@ -429,6 +499,7 @@ def diff_nested(
             _eq = (a_, b_)
             accept = 1
             _dig = None
+            is_nested = False
 
         else:  # inputs are not containers
             return bool(a_ == b_)
@@ -436,20 +507,23 @@ def diff_nested(
     else:  # inputs are not the same type
         return bool(a_ == b_)
 
-    result = diff(
-        a=a,
-        b=b,
-        eq=_eq,
-        accept=accept,
-        min_ratio=min_ratio_here,
-        max_cost=max_cost_here,
-        max_calls=max_calls_here,
-        max_recursion=max_recursion_here,
-        eq_only=eq_only,
-        kernel=kernel,
-        rtn_diff=rtn_diff,
-        dig=_dig,
-        strict=True,
-    )
-
-    return result
+    try:
+        return diff(
+            a=a,
+            b=b,
+            eq=_eq,
+            accept=accept,
+            min_ratio=min_ratio_here,
+            max_cost=max_cost_here,
+            max_calls=max_calls_here,
+            max_recursion=max_recursion_here,
+            eq_only=eq_only,
+            kernel=kernel,
+            rtn_diff=rtn_diff,
+            dig=_dig,
+            strict=True,
+        )
+    finally:
+        if is_nested:
+            _blacklist_a.discard(id(a_))
+            _blacklist_b.discard(id(b_))
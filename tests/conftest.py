@@ -7,6 +7,24 @@ def pytest_addoption(parser):
         action="store_true",
         help="tests whether diff renders are the same as those in the source tree"
     )
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        help="runs tests marked as slow, such as the largest benchmarks"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: a long-running test skipped unless --run-slow is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
 
 
 @pytest.fixture(scope='session')
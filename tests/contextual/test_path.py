@@ -0,0 +1,111 @@
+import gc
+import os
+
+import pytest
+import pandas as pd
+
+from rdiff.contextual import path
+from rdiff.contextual.path import diff_path, diff_text, PathDiff, _binary_eq, _read_csv, _read_csv_pd
+from rdiff.contextual.table import TableDiff
+from rdiff.contextual.text import TextDiff
+
+
+@pytest.mark.parametrize("data_a, data_b, expected", [
+    (b"", b"", True),
+    (b"abc" * 1000, b"abc" * 1000, True),
+    (b"abc", b"abcd", False),
+    (b"abc" * 1000, b"abc" * 999 + b"abd", False),
+])
+def test_binary_eq(tmp_path, data_a, data_b, expected):
+    (a := tmp_path / "a").write_bytes(data_a)
+    (b := tmp_path / "b").write_bytes(data_b)
+    assert _binary_eq(a, b, block_size=256) is expected
+
+
+def test_same_file(tmp_path):
+    (a := tmp_path / "a").write_text("abc")
+    (b := tmp_path / "b").hardlink_to(a)
+    assert diff_path(a, b, "ab") == PathDiff("ab", eq=True, message="same file")
+
+
+@pytest.mark.parametrize("data", [
+    b"a,b\n1,2\n,x\n",
+    b'a,b\n"x, y",""\n"multi\nline",NA\n',
+    b"\xef\xbb\xbfa,b\r\n1,0012\r\n",
+    b"a,a\n1,2\n",
+    b"a,b\n1,2,3\n",
+    b"a,b\n\xff,2\n",
+    b"a,b,\n1,2,\n",
+    b",b\n1,2\n",
+    b"a,b\nx\x00y,2\n\x00,3\n",
+])
+def test_read_csv(tmp_path, data):
+    (a := tmp_path / "a.csv").write_bytes(data)
+    result = _read_csv(a)
+    expected = _read_csv_pd(a)
+    assert result.equals(expected)
+    assert list(result.columns) == list(expected.columns)
+
+
+@pytest.mark.parametrize("data_a, data_b, expected_a, expected_b", [
+    (b"a\nb\n", b"a\nc\n", ["a\n", "b\n"], ["a\n", "c\n"]),
+    (b"a\r\nb\r\n", b"a\r\nb", ["a\n", "b\n"], ["a\n", "b"]),
+    (b"a\rb\r", b"a\rc\r", ["a\n", "b\n"], ["a\n", "c\n"]),
+    (b"x\ny\n", b"", ["x\n", "y\n"], []),
+])
+def test_diff_text_lines(tmp_path, data_a, data_b, expected_a, expected_b):
+    (a := tmp_path / "a").write_bytes(data_a)
+    (b := tmp_path / "b").write_bytes(data_b)
+    result = diff_text(a, b, "ab")
+    assert result.data.get_a() == expected_a
+    assert result.data.get_b() == expected_b
+    for chunk in result.data.diffs:
+        assert type(chunk.data_a) is list
+        assert type(chunk.data_b) is list
+    assert result == diff_text(a, b, "ab")
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd")
+def test_diff_text_closes_files(tmp_path):
+    (a := tmp_path / "a").write_text("a\nb\n")
+    (b := tmp_path / "b").write_text("c\nd\n")
+    gc.disable()
+    try:
+        n_fd = len(os.listdir("/proc/self/fd"))
+        for _ in range(10):
+            diff_text(a, b, "ab")
+        assert len(os.listdir("/proc/self/fd")) == n_fd
+    finally:
+        gc.enable()
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_excel_workers(tmp_path, max_workers):
+    for name, value in ("a", "1"), ("b", "2"):
+        with pd.ExcelWriter(tmp_path / f"{name}.xlsx") as writer:
+            pd.DataFrame({"x": ["0", "1"]}).to_excel(writer, sheet_name="same", index=False)
+            pd.DataFrame({"x": ["0", value]}).to_excel(writer, sheet_name="other", index=False)
+    result = diff_path(tmp_path / "a.xlsx", tmp_path / "b.xlsx", "ab", table_max_workers=max_workers)
+    assert {i.name: i.is_eq() for i in result.items} == {"ab/same": True, "ab/other": False}
+
+
+@pytest.mark.parametrize("file_name, data_a, data_b, expected", [
+    ("a.txt", b"hello\nworld\n", b"hello\nthere\n", TextDiff),
+    ("noext", b"hello\nworld\n", b"hello\nthere\n", TextDiff),
+    ("a.py", b"import os\n", b"import sys\n", TextDiff),
+    ("a.csv", b"x,y\n1,2\n", b"x,y\n1,3\n", TableDiff),
+    ("a.txt", b"", b"hello\n", TextDiff),
+    ("noext", b"", b"hello\n", TextDiff),
+    ("a.txt", b"\x00\x01\xff" * 8, b"\x00\x02\xff" * 8, PathDiff),
+    ("a.csv", b"\x00\x01\xff" * 8, b"\x00\x02\xff" * 8, PathDiff),
+    ("noext", b"\xff\xfe\x00\xd8\x00" * 8, b"\xff\xfe\x01\xd8\x00" * 8, PathDiff),
+])
+def test_puremagic_fallback(monkeypatch, tmp_path, file_name, data_a, data_b, expected):
+    pytest.importorskip("puremagic")
+    monkeypatch.setattr(path, "magic_guess_custom", None)
+    path._guess_mime_cached.cache_clear()
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (a := tmp_path / "a" / file_name).write_bytes(data_a)
+    (b := tmp_path / "b" / file_name).write_bytes(data_b)
+    assert isinstance(diff_path(a, b, file_name), expected)
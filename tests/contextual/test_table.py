@@ -4,8 +4,9 @@ from textwrap import dedent
 import pytest
 import numpy as np
 import pandas as pd
+from numpy.testing import assert_array_equal
 
-from rdiff.contextual.table import diff, TableDiff
+from rdiff.contextual.table import diff, TableDiff, Columns
 from rdiff.numpy import NumpyDiff
 from rdiff.chunk import Diff, Chunk, Signature, ChunkSignature
 
@@ -139,3 +140,52 @@ def test_missing_2(monkeypatch, a):
         ),
         columns=None,
     )
+
+
+@pytest.mark.parametrize("cols_b, expected", [
+    (["x", "y", "z"], True),
+    (["x", "y"], False),
+    (["x", "y", "w"], False),
+])
+def test_columns_is_eq(cols_b, expected):
+    assert Columns(np.array(["x", "y", "z"]), np.array(cols_b)).is_eq() is expected
+
+
+@pytest.mark.parametrize("cell_a, cell_b", [(1, "1"), (None, "None"), (1.5, "1.5")])
+def test_mixed_types(cell_a, cell_b):
+    a = np.array([[1, "x"], [2, "y"], [cell_a, "z"]], dtype=object)
+    b = a.copy()
+    b[2, 0] = cell_b
+    assert not diff(a, b, "table").is_eq()
+    assert diff(a, a.copy(), "table").is_eq()
+
+
+def test_renamed_column_no_rows():
+    a = pd.DataFrame([], columns=["x", "y"], dtype=str)
+    b = pd.DataFrame([], columns=["x", "z"], dtype=str)
+    result = diff(a, b, "table", columns="columns")
+    assert not result.columns.is_eq()
+    assert result.is_eq()  # equality is decided by table data alone
+
+
+def test_numeric_frame(a, a1):
+    a1 = np.delete(a1, 3, axis=0)
+    numeric = diff(pd.DataFrame(a), pd.DataFrame(a1), "table").data
+    text = diff(pd.DataFrame(a).astype(str), pd.DataFrame(a1).astype(str), "table").data
+
+    assert_array_equal(numeric.eq, text.eq)
+    assert numeric.row_diff_sig == text.row_diff_sig
+    assert numeric.col_diff_sig == text.col_diff_sig
+
+
+@pytest.mark.parametrize("dtype_a, dtype_b", [
+    (np.int64, np.float64),
+    (np.int32, np.int64),
+    (np.float64, np.float64),
+])
+def test_numeric_frame_dtypes(dtype_a, dtype_b):
+    a = pd.DataFrame({"x": [1, 2, 3], "y": [0, 4, 5]}).astype(dtype_a)
+    b = pd.DataFrame({"x": [1, 2, 3], "y": [-0.0, 4, 5]}).astype(dtype_b)
+    result = diff(a, b, "table")
+    assert result.is_eq()
+    assert result.data.eq.all()
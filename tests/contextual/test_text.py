@@ -0,0 +1,32 @@
+import pytest
+
+from rdiff.contextual.text import _LineView, _has_lone_cr
+
+
+@pytest.mark.parametrize("data, expected", [
+    (b"", []),
+    (b"\n", ["\n"]),
+    (b"a\nb\n", ["a\n", "b\n"]),
+    (b"a\r\nb", ["a\n", "b"]),
+    ("α\nβ\n".encode(), ["α\n", "β\n"]),
+])
+def test_line_view(data, expected):
+    lines = _LineView(data)
+    assert len(lines) == len(expected)
+    assert list(lines) == expected
+    assert lines[1:] == expected[1:]
+    assert repr(lines) == repr(expected)
+    if expected:
+        assert lines[-1] == expected[-1]
+    with pytest.raises(IndexError):
+        lines[len(expected)]
+
+
+@pytest.mark.parametrize("data, expected", [
+    (b"", False),
+    (b"a\nb\r\n", False),
+    (b"a\rb", True),
+    (b"a\r\nb\r", True),
+])
+def test_has_lone_cr(data, expected):
+    assert _has_lone_cr(data) is expected
@@ -1,3 +1,5 @@
+import pytest
+
 from rdiff.chunk import Diff, Chunk, Item
 
 
@@ -13,6 +15,14 @@ def test_diff():
     assert diff.get_b() == "hiworld"
 
 
+@pytest.mark.parametrize("k", [1, 10, 100, 1000])
+@pytest.mark.benchmark(group="get_a")
+def test_benchmark_get_a(benchmark, k):
+    benchmark.group = f"{benchmark.group}-{k}"
+    diff = Diff(ratio=0, diffs=[Chunk("0123456789", "", False)] * k)
+    assert benchmark(diff.get_a) == "0123456789" * k
+
+
 def test_important():
     diff_345 = Diff(ratio=2 / 3, diffs=[
         Chunk(data_a=[3], data_b=[3], eq=True),
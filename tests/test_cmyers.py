@@ -1,7 +1,12 @@
+from random import choice, randint, seed
+
+import pytest
+
 from rdiff.cmyers import (
     _test_get_protocol_obj, _test_get_protocol_call, _test_get_protocol_str, _test_get_protocol_array,
-    _test_get_protocol_numpy
+    _test_get_protocol_numpy, bitparallel_lcs_len
 )
+from rdiff.myers import search_graph_recursive
 
 
 def test_protocol_obj():
@@ -22,3 +27,21 @@ def test_protocol_array():
 
 def test_protocol_numpy():
     _test_get_protocol_numpy()
+
+
+@pytest.mark.parametrize("alphabet", ["ab", "abcdef", "aβγ€"])
+def test_bitparallel_lcs_len(alphabet):
+    seed(0)
+    for _ in range(100):
+        a = "".join(choice(alphabet) for _ in range(randint(0, 64)))
+        b = "".join(choice(alphabet) for _ in range(randint(0, 100)))
+        assert len(a) + len(b) - 2 * bitparallel_lcs_len(a, b) == search_graph_recursive(len(a), len(b), (a, b))
+
+
+@pytest.mark.parametrize("alphabet", ["ab", "aβγ€"])
+def test_bitparallel_lcs_len_long(alphabet):
+    seed(0)
+    for _ in range(10):
+        a = "".join(choice(alphabet) for _ in range(randint(0, 300)))
+        b = "".join(choice(alphabet) for _ in range(randint(0, 300)))
+        assert len(a) + len(b) - 2 * bitparallel_lcs_len(a, b) == search_graph_recursive(len(a), len(b), (a, b))
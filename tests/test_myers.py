@@ -2,15 +2,28 @@ import array
 from random import choice, randint, seed
 import warnings
 
+import numpy as np
 import pytest
 
 from rdiff.myers import search_graph_recursive
-from rdiff.cmyers import search_graph_recursive as csearch_graph_recursive
+from rdiff.cmyers import search_graph_recursive as csearch_graph_recursive, canonize as ccanonize
 from rdiff.sequence import canonize
 
 
 def compute_cost(codes):
-    return sum(i % 3 != 0 for i in codes)
+    return int(np.count_nonzero(np.frombuffer(codes, dtype=np.int8) % 3))
+
+
+def run_benchmark(benchmark, driver, n, m, compare, rtn_diff, rounds=10):
+    """Benchmarks a driver with a fresh output buffer in every round."""
+    result = [None]
+
+    def setup():
+        result[0] = array.array('b', b'\xFF' * (n + m)) if rtn_diff else None
+        return (n, m, compare, result[0]), {}
+
+    cost = benchmark.pedantic(driver, setup=setup, rounds=rounds, iterations=1)
+    return cost, result[0]
 
 
 @pytest.mark.parametrize("driver", [search_graph_recursive, csearch_graph_recursive])
@@ -129,18 +142,14 @@ def test_benchmark_call_long_short(driver, benchmark, n, rtn_diff):
         seed(j + (i << 16))
         return choice([0, 1])
 
-    if rtn_diff:
-        result = array.array('b', b'\xFF' * (4 * n))
-    else:
-        result = None
-    cost = benchmark(driver, 3 * n, n, compare, result)
+    cost, result = run_benchmark(benchmark, driver, 3 * n, n, compare, rtn_diff)
     if rtn_diff:
         assert compute_cost(result) == cost
     assert cost == 2 * n
 
 
 @pytest.mark.parametrize("driver", [search_graph_recursive, csearch_graph_recursive])
-@pytest.mark.parametrize("n", [256, 512, 1024])
+@pytest.mark.parametrize("n", [256, 512, pytest.param(1024, marks=pytest.mark.slow)])
 @pytest.mark.parametrize("rtn_diff", [False, True])
 @pytest.mark.benchmark(group="unicode")
 def test_benchmark_str_long_short(driver, benchmark, n, rtn_diff):
@@ -148,29 +157,22 @@ def test_benchmark_str_long_short(driver, benchmark, n, rtn_diff):
     long_seq = ''.join(choice("ac") for _ in range(3 * n))
     short_seq = ''.join(choice("ac") for _ in range(n))
 
-    if rtn_diff:
-        result = array.array('b', b'\xFF' * (len(long_seq) + len(short_seq)))
-    else:
-        result = None
-    cost = benchmark(driver, len(long_seq), len(short_seq), (long_seq, short_seq), result)
+    cost, result = run_benchmark(benchmark, driver, len(long_seq), len(short_seq), (long_seq, short_seq), rtn_diff)
     if rtn_diff:
         assert compute_cost(result) == cost
 
 
 @pytest.mark.parametrize("driver", [search_graph_recursive, csearch_graph_recursive])
-@pytest.mark.parametrize("n", [256, 512, 1024])
+@pytest.mark.parametrize("n", [256, 512, pytest.param(1024, marks=pytest.mark.slow)])
 @pytest.mark.parametrize("rtn_diff", [False, True])
 @pytest.mark.benchmark(group="array")
 def test_benchmark_array_long_short(driver, benchmark, n, rtn_diff):
     benchmark.group = f"{benchmark.group}-{n}"
-    long_seq = array.array('q', [randint(0, 1) for _ in range(3 * n)])
-    short_seq = array.array('q', [randint(0, 1) for _ in range(n)])
+    rng = np.random.default_rng(0)
+    long_seq = array.array('q', rng.integers(0, 2, 3 * n, dtype=np.int64).tobytes())
+    short_seq = array.array('q', rng.integers(0, 2, n, dtype=np.int64).tobytes())
 
-    if rtn_diff:
-        result = array.array('b', b'\xFF' * (len(long_seq) + len(short_seq)))
-    else:
-        result = None
-    cost = benchmark(driver, len(long_seq), len(short_seq), (long_seq, short_seq), result)
+    cost, result = run_benchmark(benchmark, driver, len(long_seq), len(short_seq), (long_seq, short_seq), rtn_diff)
     if rtn_diff:
         assert compute_cost(result) == cost
 
@@ -184,11 +186,17 @@ def test_benchmark_list_long_short(driver, benchmark, n, rtn_diff):
     long_seq = [randint(0, 1) for _ in range(3 * n)]
     short_seq = [randint(0, 1) for _ in range(n)]
 
-    if rtn_diff:
-        result = array.array('b', b'\xFF' * (len(long_seq) + len(short_seq)))
-    else:
-        result = None
-    cost = benchmark(driver, len(long_seq), len(short_seq), (long_seq, short_seq), result)
+    cost, result = run_benchmark(benchmark, driver, len(long_seq), len(short_seq), (long_seq, short_seq), rtn_diff)
     if rtn_diff:
         assert compute_cost(result) == cost
     assert cost == 2 * n
+
+
+@pytest.mark.parametrize("n", [0, 1, 10, 100])
+def test_canonize_c(n):
+    seed(n)
+    codes = array.array('b', (choice([0, 1, 2, 3, 5, 6]) for _ in range(n)))
+    expected = array.array('b', codes)
+    canonize(expected)
+    ccanonize(codes)
+    assert codes == expected
@@ -4,18 +4,22 @@ import pytest
 from rdiff.chunk import Diff, Chunk, Signature, ChunkSignature
 from rdiff.numpy import diff, get_row_col_diff, align_inflate, diff_aligned_2d, NumpyDiff
 
-from .util import np_chunk_eq, np_chunk_eq_aligned, np_raw_diff_eq
+from .util import np_chunk_eq, np_chunk_eq_aligned, np_raw_diff_eq, insert_2d
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def a():
     np.random.seed(0)
-    return np.random.randint(0, 10, size=(10, 10))
+    result = np.random.randint(0, 10, size=(10, 10))
+    result.setflags(write=False)
+    return result
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def a1(a):
-    return a + np.eye(10, dtype=a.dtype)
+    result = a + np.eye(10, dtype=a.dtype)
+    result.setflags(write=False)
+    return result
 
 
 def test_equal(monkeypatch, a):
@@ -66,66 +70,34 @@ def test_random(monkeypatch, a):
     )
 
 
-def test_row_col_sig_eq_0(a):
-    assert get_row_col_diff(a, a) == (
-        Signature(parts=(ChunkSignature(10, 10, True),)),
-        Signature(parts=(ChunkSignature(10, 10, True),)),
-    )
-
-
-def test_row_col_sig_eq_1(a, a1):
-    assert get_row_col_diff(a, a1) == (
-        Signature(parts=(ChunkSignature(10, 10, True),)),
-        Signature(parts=(ChunkSignature(10, 10, True),)),
-    )
+_sig_aligned = Signature(parts=(
+    ChunkSignature(10, 10, True),
+))
+_sig_split = Signature(parts=(
+    ChunkSignature(4, 4, True),
+    ChunkSignature(1, 1, False),
+    ChunkSignature(5, 5, True),
+))
 
 
-def test_row_col_sig_row(a):
+def _bump(a, row=None, col=None):
     b = a.copy()
-    b[4] += 1
-    assert get_row_col_diff(a, b) == (
-        Signature(parts=(
-            ChunkSignature(4, 4, True),
-            ChunkSignature(1, 1, False),
-            ChunkSignature(5, 5, True),
-        )),
-        Signature(parts=(
-            ChunkSignature(10, 10, True),
-        )),
-    )
+    if row is not None:
+        b[row] += 1
+    if col is not None:
+        b[:, col] += 1
+    return b
 
 
-def test_row_col_sig_col(a):
-    b = a.copy()
-    b[:, 4] += 1
-    assert get_row_col_diff(a, b) == (
-        Signature(parts=(
-            ChunkSignature(10, 10, True),
-        )),
-        Signature(parts=(
-            ChunkSignature(4, 4, True),
-            ChunkSignature(1, 1, False),
-            ChunkSignature(5, 5, True),
-        )),
-    )
-
-
-def test_row_col_sig_row_col(a):
-    b = a.copy()
-    b[4] += 1
-    b[:, 4] += 1
-    assert get_row_col_diff(a, b) == (
-        Signature(parts=(
-            ChunkSignature(4, 4, True),
-            ChunkSignature(1, 1, False),
-            ChunkSignature(5, 5, True),
-        )),
-        Signature(parts=(
-            ChunkSignature(4, 4, True),
-            ChunkSignature(1, 1, False),
-            ChunkSignature(5, 5, True),
-        )),
-    )
+@pytest.mark.parametrize("get_b, row_sig, col_sig", [
+    pytest.param(lambda a, a1: a, _sig_aligned, _sig_aligned, id="eq_0"),
+    pytest.param(lambda a, a1: a1, _sig_aligned, _sig_aligned, id="eq_1"),
+    pytest.param(lambda a, a1: _bump(a, row=4), _sig_split, _sig_aligned, id="row"),
+    pytest.param(lambda a, a1: _bump(a, col=4), _sig_aligned, _sig_split, id="col"),
+    pytest.param(lambda a, a1: _bump(a, row=4, col=4), _sig_split, _sig_split, id="row_col"),
+])
+def test_row_col_sig(a, a1, get_b, row_sig, col_sig):
+    assert get_row_col_diff(a, get_b(a, a1)) == (row_sig, col_sig)
 
 
 def test_align_inflate():
@@ -137,8 +109,8 @@ def test_align_inflate():
         ChunkSignature(size_a=2, size_b=2, eq=True),
     ])
     a_, b_ = align_inflate(a, b, -1, s, 0)
-    assert (a_ == np.array([0, 1, 2, -1, -1, -1, 3, 4])).all()
-    assert (b_ == np.array([5, -1, -1, 6, 7, 8, 9, 10])).all()
+    assert np.array_equal(a_, np.array([0, 1, 2, -1, -1, -1, 3, 4]))
+    assert np.array_equal(b_, np.array([5, -1, -1, 6, 7, 8, 9, 10]))
 
 
 @pytest.mark.parametrize("col_diff_sig", [None, Signature(parts=(ChunkSignature(10, 10, True),))])
@@ -223,8 +195,8 @@ def test_diff_aligned_2d_new_col(monkeypatch, a, a1):
 def test_diff_aligned_2d_new_row_col(monkeypatch, a, a1):
     monkeypatch.setattr(NumpyDiff, "__eq__", np_raw_diff_eq)
 
-    at = np.insert(np.insert(a, 4, 0, axis=0), 8, 0, axis=1)
-    bt = np.insert(np.insert(a1, 4, 0, axis=0), 8, 0, axis=1)
+    at = insert_2d(a, 4, 8, 0)
+    bt = insert_2d(a1, 4, 8, 0)
     mask = at == bt
     mask[4, :] = mask[:, 8] = False
 
@@ -248,11 +220,11 @@ def test_diff_aligned_2d_new_row_col(monkeypatch, a, a1):
 def test_diff_aligned_2d_mix_0(monkeypatch, a, a1):
     monkeypatch.setattr(NumpyDiff, "__eq__", np_raw_diff_eq)
 
-    a = np.insert(np.insert(a, 4, 42, axis=0), 8, 42, axis=1)
-    a1 = np.insert(np.insert(a1, 4, 89, axis=0), 8, 89, axis=1)
+    a = insert_2d(a, 4, 8, 42)
+    a1 = insert_2d(a1, 4, 8, 89)
 
-    at = np.insert(np.insert(a, 5, 0, axis=0), 9, 0, axis=1)
-    bt = np.insert(np.insert(a1, 4, 0, axis=0), 8, 0, axis=1)
+    at = insert_2d(a, 5, 9, 0)
+    bt = insert_2d(a1, 4, 8, 0)
     mask = at == bt
     mask[4:6, :] = mask[:, 8:10] = False
 
@@ -4,31 +4,31 @@ from rdiff.cli.path_util import iterdir, iter_match, accept_all, accept_folders,
 
 
 def test_no_files(tmp_path):
-    assert set(iterdir(tmp_path, rules=[reject_all])) == set()
+    assert sorted(iterdir(tmp_path, rules=[reject_all])) == []
 
 
 def test_no_files_r(tmp_path):
-    assert set(iterdir(tmp_path, rules=[accept_all])) == {
+    assert sorted(iterdir(tmp_path, rules=[accept_all])) == sorted([
         (tmp_path, accept_all, "./"),
-    }
+    ])
 
 
 def test_simple(tmp_path):
     (tmp_path / "1.txt").touch()
     (tmp_path / "data").touch()
 
-    assert set(iterdir(tmp_path, rules=[reject_all])) == set()
+    assert sorted(iterdir(tmp_path, rules=[reject_all])) == []
 
 
 def test_simple_r(tmp_path):
     (tmp_path / "1.txt").touch()
     (tmp_path / "data").touch()
 
-    assert set(iterdir(tmp_path, rules=[accept_all])) == {
+    assert sorted(iterdir(tmp_path, rules=[accept_all])) == sorted([
         (tmp_path, accept_all, "./"),
         (tmp_path / "1.txt", accept_all, "1.txt"),
         (tmp_path / "data", accept_all, "data"),
-    }
+    ])
 
 
 def test_simple_depth_r(tmp_path):
@@ -36,12 +36,12 @@ def test_simple_depth_r(tmp_path):
     (tmp_path / "data").mkdir()
     (tmp_path / "data" / "2.txt").touch()
 
-    assert set(iterdir(tmp_path, rules=[accept_all])) == {
+    assert sorted(iterdir(tmp_path, rules=[accept_all])) == sorted([
         (tmp_path, accept_all, "./"),
         (tmp_path / "1.txt", accept_all, "1.txt"),
         (tmp_path / "data", accept_all, "data/"),
         (tmp_path / "data/2.txt", accept_all, "data/2.txt"),
-    }
+    ])
 
 
 def test_simple_exclude(tmp_path):
@@ -50,10 +50,10 @@ def test_simple_exclude(tmp_path):
 
     rules = [glob_rule(False, "1.txt"), accept_all]
 
-    assert set(iterdir(tmp_path, rules=rules)) == {
+    assert sorted(iterdir(tmp_path, rules=rules)) == sorted([
         (tmp_path, accept_all, "./"),
         (tmp_path / "data", accept_all, "data"),
-    }
+    ])
 
 
 def test_simple_include(tmp_path):
@@ -62,10 +62,10 @@ def test_simple_include(tmp_path):
 
     rules = [glob_rule(True, "1.txt"), accept_folders, reject_all]
 
-    assert set(iterdir(tmp_path, rules=rules)) == {
+    assert sorted(iterdir(tmp_path, rules=rules)) == sorted([
         (tmp_path, accept_folders, "./"),
         (tmp_path / "1.txt", rules[0], "1.txt"),
-    }
+    ])
 
 def test_nested(tmp_path):
     (tmp_path / "1.txt").touch()
@@ -78,11 +78,11 @@ def test_nested(tmp_path):
         glob_rule(True, "./"),
     ]
 
-    assert set(iterdir(tmp_path, rules=rules)) == {
+    assert sorted(iterdir(tmp_path, rules=rules)) == sorted([
         (tmp_path, rules[2], "./"),
         (tmp_path / "1.txt", rules[0], "1.txt"),
         (tmp_path / "data", rules[1], "data/"),
-    }
+    ])
 
 
 def test_nested_all(tmp_path):
@@ -95,12 +95,12 @@ def test_nested_all(tmp_path):
         accept_folders,
     ]
 
-    assert set(iterdir(tmp_path, rules=rules)) == {
+    assert sorted(iterdir(tmp_path, rules=rules)) == sorted([
         (tmp_path, accept_folders, "./"),
         (tmp_path / "1.txt", rules[0], "1.txt"),
         (tmp_path / "data", accept_folders, "data/"),
         (tmp_path / "data/1.txt", rules[0], "data/1.txt"),
-    }
+    ])
 
 
 def test_nested_some(tmp_path):
@@ -113,10 +113,10 @@ def test_nested_some(tmp_path):
         glob_rule(True, "./"),
     ]
 
-    assert set(iterdir(tmp_path, rules=rules)) == {
+    assert sorted(iterdir(tmp_path, rules=rules)) == sorted([
         (tmp_path, rules[1], "./"),
         (tmp_path / "1.txt", rules[0], "1.txt"),
-    }
+    ])
 
 
 def test_nested_complex(tmp_path):
@@ -135,12 +135,12 @@ def test_nested_complex(tmp_path):
         glob_rule(True, "data/stuff/something.txt"),
     ]
 
-    assert set(iterdir(tmp_path, rules=rules)) == {
+    assert sorted(iterdir(tmp_path, rules=rules)) == sorted([
         (tmp_path, rules[0], "./"),
         (tmp_path / "data", rules[1], "data/"),
         (tmp_path / "data/important", rules[2], "data/important/"),
         (tmp_path / "data/important/file.txt", rules[3], "data/important/file.txt"),
-    }
+    ])
 
 
 @pytest.fixture
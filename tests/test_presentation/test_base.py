@@ -3,7 +3,7 @@ from pathlib import Path
 import pytest
 import pandas as pd
 
-from rdiff.presentation.base import MarkdownTableFormats, SummaryTextPrinter
+from rdiff.presentation.base import MarkdownTableFormats, SummaryTextPrinter, compile_format
 
 from .util import diff2text, self_extract, sync_contents
 
@@ -50,3 +50,8 @@ def test_git_history(tmp_path, test_diff_renders, args, name):
     self_extract("e807d333433209f9328decc8290d40c270d832cd", b := tmp_path / "b")
     text = diff2text(a, b, **args)
     sync_contents(cases / f"git/diff-{name}.txt", text, test_diff_renders)
+
+
+@pytest.mark.parametrize("fmt", ["> %s", "%s", "---%s---", "%% %s", "%r"])
+def test_compile_format(fmt):
+    assert compile_format(fmt)("x") == fmt % ("x",)
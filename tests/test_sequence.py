@@ -2,6 +2,7 @@ import pytest
 import numpy as np
 from array import array
 
+from rdiff import sequence
 from rdiff.sequence import diff, diff_nested
 from rdiff.chunk import Diff, Chunk
 
@@ -27,6 +28,11 @@ def test_equal_str(kernel):
     )
 
 
+@pytest.mark.parametrize("rtn_diff", [True, False])
+def test_equal_str_ratio_type(rtn_diff):
+    assert type(diff("ab", "ab", rtn_diff=rtn_diff).ratio) is float
+
+
 @pytest.mark.parametrize("kernel", ["py", "c"])
 def test_sub_str(kernel):
     assert diff("ice", "alice bob", kernel=kernel, min_ratio=0) == Diff(
@@ -309,6 +315,34 @@ def test_big_np(monkeypatch, benchmark, max_depth):
     assert benchmark(diff_nested, a, b, min_ratio=0, max_depth=max_depth).ratio > 0
 
 
+def _edited_text(n, n_edits):
+    rng = np.random.default_rng(0)
+    a = rng.choice(list("abcdefghij"), size=n)
+    b = a.copy()
+    b[rng.choice(n, size=n_edits, replace=False)] = "k"
+    return "".join(a), "".join(b)
+
+
+@pytest.mark.parametrize("n, n_edits", [(40, 1), (200, 2), (2000, 5), (2000, 50), (2000, 500)])
+def test_cost_only_str(monkeypatch, n, n_edits):
+    a, b = _edited_text(n, n_edits)
+    expected = diff(a, b, rtn_diff=False, kernel="py").ratio
+    assert diff(a, b, rtn_diff=False).ratio == expected
+    monkeypatch.setattr(sequence, "_bitparallel_myers_ratio", 1 << 30)  # always bit-parallel
+    assert diff(a, b, rtn_diff=False).ratio == expected
+
+
+@pytest.mark.parametrize("bitparallel", [True, False])
+@pytest.mark.parametrize("n, n_edits", [(40, 1), (200, 2), (2000, 5), (2000, 50), (2000, 500)])
+@pytest.mark.benchmark(group="cost-only-str")
+def test_benchmark_cost_only_str(monkeypatch, benchmark, bitparallel, n, n_edits):
+    benchmark.group = f"{benchmark.group}-{n}-{n_edits}"
+    if not bitparallel:
+        monkeypatch.setattr(sequence, "_bitparallel_max_cells", 0)
+    a, b = _edited_text(n, n_edits)
+    benchmark(diff, a, b, rtn_diff=False)
+
+
 def test_strictly_no_python_0():
     with pytest.raises(ValueError, match="failed to pick a suitable protocol"):
         diff([0, 1, 2], [0, 1, 2], no_python=True)
@@ -336,3 +370,29 @@ def test_strictly_no_python_4(dtype):
 def test_bug_0():
     a, b = 'comparing a.csv/b.csvX', 'comparing .X'
     assert diff(a, b, eq_only=True, min_ratio=0.75).ratio < 0.75
+
+
+def test_long_diff_chunks(monkeypatch):
+    a = "abcdefgh" * 100
+    b = a.replace("c", "X").replace("fg", "")
+    expected = diff(a, b, min_ratio=0)
+    assert expected.get_a() == a
+    assert expected.get_b() == b
+
+    monkeypatch.setattr(sequence, "_vectorize_codes_min_len", 0)
+    assert diff(a, b, min_ratio=0) == expected
+
+
+def test_nested_recursive():
+    a = [1, 2]
+    a.append(a)
+    b = [1, 2]
+    b.append(b)
+    with pytest.raises(ValueError, match="recursive nesting"):
+        diff_nested(a, b, min_ratio=0)
+
+
+def test_nested_repeated_siblings():
+    x = [1, 2, 3, 4]
+    result = diff_nested([x, x, [x]], [x, [1, 2, 3, 5], [x]], min_ratio=0)
+    assert result.ratio == 1
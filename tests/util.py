@@ -1,14 +1,26 @@
+import numpy as np
+
 from rdiff.chunk import Chunk
 from rdiff.numpy import NumpyDiff
 
 
 def np_chunk_eq(a: Chunk, b: Chunk) -> bool:
-    return (a.data_a == b.data_a).all() and (a.data_b == b.data_b).all() and a.eq == b.eq
+    return np.array_equal(a.data_a, b.data_a) and np.array_equal(a.data_b, b.data_b) and a.eq == b.eq
 
 
 def np_chunk_eq_aligned(a: Chunk, b: Chunk) -> bool:
-     return (a.data_a == b.data_a).all() and (a.data_b == b.data_b).all() and (str(a.eq) == str(b.eq))
+     return np.array_equal(a.data_a, b.data_a) and np.array_equal(a.data_b, b.data_b) and (str(a.eq) == str(b.eq))
 
 
 def np_raw_diff_eq(a: NumpyDiff, b:NumpyDiff) -> bool:
-    return (a.a == b.a).all() and (a.b == b.b).all() and (a.eq == b.eq).all() and a.row_diff_sig == b.row_diff_sig and a.col_diff_sig == b.col_diff_sig
+    return np.array_equal(a.a, b.a) and np.array_equal(a.b, b.b) and np.array_equal(a.eq, b.eq) and a.row_diff_sig == b.row_diff_sig and a.col_diff_sig == b.col_diff_sig
+
+
+def insert_2d(a: np.ndarray, row: int, col: int, fill=0) -> np.ndarray:
+    n, m = a.shape
+    result = np.full((n + 1, m + 1), fill, dtype=a.dtype)
+    result[:row, :col] = a[:row, :col]
+    result[:row, col + 1:] = a[:row, col:]
+    result[row + 1:, :col] = a[row:, :col]
+    result[row + 1:, col + 1:] = a[row:, col:]
+    return result